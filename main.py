@@ -1,14 +1,344 @@
 # Import required system and custom modules
 import sys
-from partition.memory_classes import Partition, Job
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from functools import partial
+from partition.memory_classes import Partition, Job, STATUS_NAMES
 from partition.algorithms import first_fit, best_fit, worst_fit, next_fit, deallocate
+from partition.queues import WaitingQueue
 # Import PyQt5 GUI components
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-    QTableWidgetItem, QLineEdit, QPushButton, QLabel, QHeaderView, QComboBox, QSizePolicy
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+    QLineEdit, QPushButton, QLabel, QHeaderView, QComboBox, QSizePolicy
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QFont, QStandardItem
+
+# ==================== STYLE SHEET ====================
+
+# Application-wide style sheet, parsed once and applied in main().
+# Widgets that need a specific look are selected by object name.
+APP_QSS = """
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+    QWidget {
+        background-color: #f5f5f5;
+    }
+
+    /* Input text fields (memory needed, memory space) */
+    QLineEdit {
+        border: 2px solid #ddd;
+        border-radius: 8px;
+        padding: 10px 14px;
+        background-color: white;
+        font-size: 14px;
+        color: #333;
+    }
+    QLineEdit:hover {
+        border: 2px solid #bbb;
+    }
+    QLineEdit:focus {
+        border: 2px solid #4CAF50;
+        background-color: #fafafa;
+    }
+
+    /* Add buttons (Add Job, Add Partition) */
+    QPushButton#addBtn {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        font-weight: bold;
+        font-size: 14px;
+        padding: 14px 20px;
+    }
+    QPushButton#addBtn:hover {
+        background-color: #45a049;
+    }
+    QPushButton#addBtn:pressed {
+        background-color: #3d8b40;
+    }
+
+    /* Table views (Jobs and Partitions tables) */
+    QTableView {
+        border: 2px solid #ddd;
+        border-radius: 8px;
+        background-color: white;
+        alternate-background-color: #f9f9f9;
+        gridline-color: #e8e8e8;
+        selection-background-color: #e3f2fd;
+    }
+    QTableView::item {
+        padding: 8px;
+        color: #333;
+    }
+    QTableView::item:selected {
+        background-color: #bbdefb;
+        color: #000;
+    }
+    QHeaderView::section {
+        background-color: #4CAF50;
+        color: white;
+        padding: 10px;
+        border: none;
+        font-weight: bold;
+        font-size: 13px;
+        border-right: 1px solid #45a049;
+    }
+    QHeaderView::section:last {
+        border-right: none;
+    }
+
+    /* Regular labels */
+    QLabel {
+        color: #333;
+        font-weight: bold;
+        font-size: 16px;
+        padding: 5px 0;
+    }
+
+    /* Section header labels */
+    QLabel#sectionLabel {
+        color: #2c3e50;
+        font-weight: bold;
+        font-size: 20px;
+        padding: 8px 0;
+        border-bottom: 3px solid #4CAF50;
+        margin-bottom: 10px;
+    }
+
+    /* Combo boxes (dropdowns) */
+    QComboBox {
+        border: 2px solid #ddd;
+        border-radius: 8px;
+        padding: 8px 12px;
+        background-color: white;
+        font-size: 14px;
+        color: #333;
+    }
+    QComboBox:hover {
+        border: 2px solid #bbb;
+    }
+    QComboBox:focus {
+        border: 2px solid #2196F3;
+    }
+    QComboBox::drop-down {
+        border: none;
+        width: 30px;
+    }
+    QComboBox QAbstractItemView {
+        border: 2px solid #ddd;
+        border-radius: 8px;
+        background-color: white;
+        selection-background-color: #2196F3;
+        selection-color: white;
+        padding: 5px;
+    }
+
+    /* Allocate button */
+    QPushButton#allocateBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #2196F3, stop:1 #1976D2);
+        color: white;
+        border: none;
+        border-radius: 12px;
+        font-weight: bold;
+        font-size: 20px;
+    }
+    QPushButton#allocateBtn:hover {
+        background: #2196F3;
+    }
+    QPushButton#allocateBtn:pressed {
+        background: #1565C0;
+    }
+
+    /* Deallocate button */
+    QPushButton#deallocateBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #FF9800, stop:1 #F57C00);
+        color: white;
+        border: none;
+        border-radius: 12px;
+        font-weight: bold;
+        font-size: 20px;
+    }
+    QPushButton#deallocateBtn:hover {
+        background: #FF9800;
+    }
+    QPushButton#deallocateBtn:pressed {
+        background: #E65100;
+    }
+
+    /* Reset button */
+    QPushButton#resetBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #F44336, stop:1 #D32F2F);
+        color: white;
+        border: none;
+        border-radius: 10px;
+        font-weight: bold;
+        font-size: 16px;
+        padding: 20px;
+    }
+    QPushButton#resetBtn:hover {
+        background: #F44336;
+    }
+    QPushButton#resetBtn:pressed {
+        background: #B71C1C;
+    }
+"""
+
+@contextmanager
+def batched_updates(*widgets):
+    """
+    Suspend repaints and signals on widgets while they are bulk-updated.
+    Each widget is repainted once when the block exits.
+    
+    Args:
+        widgets: Qt widgets whose contents are about to change
+    """
+    for widget in widgets:
+        widget.setUpdatesEnabled(False)  # Defer repaint until all changes are made
+        widget.blockSignals(True)  # Avoid per-item change notifications
+    try:
+        yield widgets
+    finally:
+        for widget in widgets:
+            widget.blockSignals(False)
+            widget.setUpdatesEnabled(True)  # Triggers a single repaint
+
+class ListTableModel(QAbstractTableModel):
+    """
+    Read-only table model that displays a Python list with one object per row.
+    The view pulls cell text on demand, so no per-cell items are kept.
+    """
+    
+    headers = ()  # Column titles, defined by subclasses
+    alignment = int(Qt.AlignCenter)  # Text alignment shared by every cell, converted once
+    
+    def __init__(self, rows, parent=None):
+        """
+        Initialize the model over an existing list.
+        
+        Args:
+            rows: List of objects to display (shared, not copied)
+            parent: Optional Qt parent object
+        """
+        super().__init__(parent)
+        self._rows = rows  # Backing list; mutate it only through append()/clear()
+        self._row_of = {obj: row for row, obj in enumerate(rows)}  # Object -> row index
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of objects in the backing list."""
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of columns defined by the subclass."""
+        return 0 if parent.isValid() else len(self.headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the display text and alignment for a cell."""
+        if role == Qt.DisplayRole and index.isValid():
+            return self.display(self._rows[index.row()], index.column())
+        if role == Qt.TextAlignmentRole:
+            return self.alignment
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Return column titles; row numbers come from the base class."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+    
+    def display(self, obj, column):
+        """
+        Return the text shown for one object in one column.
+        
+        Args:
+            obj: Object from the backing list
+            column: Column index
+        """
+        raise NotImplementedError
+    
+    def append(self, obj):
+        """
+        Add an object to the end of the backing list and insert its row.
+        
+        Args:
+            obj: Object to display
+        """
+        self.extend([obj])
+    
+    def extend(self, objs):
+        """
+        Add several objects to the end of the backing list with a single row insertion.
+        
+        Args:
+            objs: List of objects to display
+        """
+        if not objs:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(objs) - 1)
+        self._rows.extend(objs)
+        for row, obj in enumerate(objs, first):
+            self._row_of[obj] = row
+        self.endInsertRows()
+    
+    def clear(self):
+        """Empty the backing list and reset the view."""
+        self.beginResetModel()
+        self._rows.clear()
+        self._row_of.clear()
+        self.endResetModel()
+    
+    def refresh_cells(self, objs, column):
+        """
+        Notify views that one column changed for the given objects only.
+        
+        Args:
+            objs: Objects from the backing list whose cells changed
+            column: Column index to refresh
+        """
+        for obj in objs:
+            index = self.index(self._row_of[obj], column)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+class JobsModel(ListTableModel):
+    """
+    Table model for the jobs list: ID, memory needed and status.
+    """
+    
+    headers = ("Job ID", "Memory Needed", "Status")
+    STATUS_COLUMN = 2
+    # Status text is looked up by status code rather than capitalized on every paint
+    STATUS_TEXT = tuple(name.capitalize() for name in STATUS_NAMES)
+    
+    def display(self, job, column):
+        """Return the text for one job cell."""
+        if column == 0:
+            return job.id_label
+        if column == 1:
+            return job.memory_label
+        return self.STATUS_TEXT[job.status]
+
+class PartitionsModel(ListTableModel):
+    """
+    Table model for the partitions list: partition and allocated job.
+    """
+    
+    headers = ("Partition", "Allocated Job")
+    JOB_COLUMN = 1
+    
+    def display(self, partition, column):
+        """Return the text for one partition cell."""
+        if column == 0:
+            return partition.label
+        # Display allocated job if partition is occupied, empty otherwise
+        if partition.current_job is not None:
+            return partition.current_job.label
+        return ""
 
 class MainWindow(QMainWindow):
     """
@@ -24,133 +354,44 @@ class MainWindow(QMainWindow):
         super().__init__()
         # Initialize data structures
         self.jobs = []  # List of all jobs (waiting, allocated, finished)
+        self._waiting = WaitingQueue()  # Waiting jobs in arrival order, with the smallest one at hand
+        self._allocated = {}  # Allocated jobs as keys, so deallocation removes them in O(1)
         self.partitions = []  # List of all memory partitions
         self.job_id = 0  # Counter for generating unique job IDs
         self.partition_id = 0  # Counter for generating unique partition IDs
         self.next_fit_last_index = 0  # Tracks last allocation position for Next Fit algorithm
-
-        # Set window background color
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QWidget {
-                background-color: #f5f5f5;
-            }
-        """)
+        self._free_partitions = []  # Size-sorted (memory_space, index) pairs for Best/Worst Fit
+        self._combo_items = {}  # Allocated job -> its item in the deallocation dropdown
+        self._combo_ids = []  # Job IDs of the dropdown rows, kept in ID order like the jobs table
+
+        # Allocation functions indexed by their position in the algorithm dropdown
+        self._algo_names = ("First Fit", "Best Fit", "Worst Fit", "Next Fit")
+        self._algo_table = (
+            first_fit,
+            partial(best_fit, free=self._free_partitions),
+            partial(worst_fit, free=self._free_partitions),
+            self._run_next_fit,
+        )
+        self._algo_idx = 0  # Index of the selected algorithm (kept in sync with the dropdown)
 
         # Initialize layout containers for three main sections
         jobs_section = QVBoxLayout()
         partitions_section = QVBoxLayout()
 
-        # ==================== STYLING DEFINITIONS ====================
-        
-        # Style for input text fields (memory needed, memory space)
-        input_field_style = """
-            QLineEdit {
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                padding: 10px 14px;
-                background-color: white;
-                font-size: 14px;
-                color: #333;
-            }
-            QLineEdit:hover {
-                border: 2px solid #bbb;
-            }
-            QLineEdit:focus {
-                border: 2px solid #4CAF50;
-                background-color: #fafafa;
-            }
-        """
-
-        # Style for add buttons (Add Job, Add Partition)
-        input_btn_style = """
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 14px 20px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """
-
-        # Style for table widgets (Jobs and Partitions tables)
-        table_style = """
-            QTableWidget {
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                background-color: white;
-                gridline-color: #e8e8e8;
-                selection-background-color: #e3f2fd;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                color: #333;
-            }
-            QTableWidget::item:selected {
-                background-color: #bbdefb;
-                color: #000;
-            }
-            QHeaderView::section {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px;
-                border: none;
-                font-weight: bold;
-                font-size: 13px;
-                border-right: 1px solid #45a049;
-            }
-            QHeaderView::section:last {
-                border-right: none;
-            }
-        """
-
-        # Style for regular labels
-        label_style = """
-            QLabel {
-                color: #333;
-                font-weight: bold;
-                font-size: 16px;
-                padding: 5px 0;
-            }
-        """
-
-        # Style for section header labels
-        section_label_style = """
-            QLabel {
-                color: #2c3e50;
-                font-weight: bold;
-                font-size: 20px;
-                padding: 8px 0;
-                border-bottom: 3px solid #4CAF50;
-                margin-bottom: 10px;
-            }
-        """
-
         # ==================== JOBS SECTION ====================
         
         # Create Jobs section header
         jobs_section_label = QLabel("📋 Jobs")
-        jobs_section_label.setStyleSheet(section_label_style)
+        jobs_section_label.setObjectName("sectionLabel")
         
         # Input field for entering job memory requirements
         self.memory_needed_field = QLineEdit()
         self.memory_needed_field.setPlaceholderText("Enter memory needed (KB)")
-        self.memory_needed_field.setStyleSheet(input_field_style)
 
         # Button to add new job
         add_job_btn = QPushButton("Add Job")
         add_job_btn.clicked.connect(self.add_job)
-        add_job_btn.setStyleSheet(input_btn_style)
+        add_job_btn.setObjectName("addBtn")
         add_job_btn.setMinimumWidth(120)
 
         # Layout for job input field and button
@@ -160,41 +401,34 @@ class MainWindow(QMainWindow):
         job_input_layout.setSpacing(10)
 
         # Table to display all jobs and their statuses
-        self.jobs_table_widget = QTableWidget()
-        self.jobs_table_widget.setEditTriggers(QTableWidget.NoEditTriggers)  # Read-only
-        self.jobs_table_widget.setColumnCount(3)
-        self.jobs_table_widget.setHorizontalHeaderLabels(["Job ID", "Memory Needed", "Status"])
-        self.jobs_table_widget.horizontalHeader().setStretchLastSection(True)
-        self.jobs_table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.jobs_table_widget.setStyleSheet(table_style)
-        self.jobs_table_widget.setAlternatingRowColors(True)  # Zebra striping for readability
-        self.jobs_table_widget.setStyleSheet(table_style + """
-            QTableWidget {
-                alternate-background-color: #f9f9f9;
-            }
-        """)
+        self.jobs_model = JobsModel(self.jobs, self)
+        self.jobs_table_view = QTableView()
+        self.jobs_table_view.setModel(self.jobs_model)
+        self.jobs_table_view.setEditTriggers(QTableView.NoEditTriggers)  # Read-only
+        self.jobs_table_view.horizontalHeader().setStretchLastSection(True)
+        self.jobs_table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.jobs_table_view.setAlternatingRowColors(True)  # Zebra striping for readability
 
         # Assemble Jobs section
         jobs_section.addWidget(jobs_section_label)
         jobs_section.addLayout(job_input_layout)
-        jobs_section.addWidget(self.jobs_table_widget)
+        jobs_section.addWidget(self.jobs_table_view)
         jobs_section.setSpacing(12)
         
         # ==================== PARTITIONS SECTION ====================
         
         # Create Partitions section header
         partitions_section_label = QLabel("💾 Partitions")
-        partitions_section_label.setStyleSheet(section_label_style)
+        partitions_section_label.setObjectName("sectionLabel")
 
         # Input field for entering partition memory size
         self.memory_space_field = QLineEdit()
         self.memory_space_field.setPlaceholderText("Enter memory space (KB)")
-        self.memory_space_field.setStyleSheet(input_field_style)
 
         # Button to add new partition
         add_partition_btn = QPushButton("Add Partition")
         add_partition_btn.clicked.connect(self.add_partition)
-        add_partition_btn.setStyleSheet(input_btn_style)
+        add_partition_btn.setObjectName("addBtn")
         add_partition_btn.setMinimumWidth(140)
 
         # Layout for partition input field and button
@@ -204,141 +438,56 @@ class MainWindow(QMainWindow):
         partition_input_layout.setSpacing(10)
 
         # Table to display all partitions and their allocations
-        self.partitions_table_widget = QTableWidget()
-        self.partitions_table_widget.setAlternatingRowColors(True)  # Zebra striping
-        self.partitions_table_widget.setStyleSheet(table_style + """
-            QTableWidget {
-                alternate-background-color: #f9f9f9;
-            }
-        """)
+        self.partitions_model = PartitionsModel(self.partitions, self)
+        self.partitions_table_view = QTableView()
+        self.partitions_table_view.setModel(self.partitions_model)
+        self.partitions_table_view.setEditTriggers(QTableView.NoEditTriggers)  # Read-only
+        self.partitions_table_view.horizontalHeader().setStretchLastSection(True)
+        self.partitions_table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.partitions_table_view.setAlternatingRowColors(True)  # Zebra striping
 
         # Assemble Partitions section
         partitions_section.addWidget(partitions_section_label)
         partitions_section.addLayout(partition_input_layout)
-        partitions_section.addWidget(self.partitions_table_widget)
+        partitions_section.addWidget(self.partitions_table_view)
         partitions_section.setSpacing(12)
 
         # ==================== OPERATIONS SECTION ====================
         
         # Create Operations section header
         operations_section_label = QLabel("⚙️ Operations")
-        operations_section_label.setStyleSheet(section_label_style)
+        operations_section_label.setObjectName("sectionLabel")
         
         # Label for algorithm selection
         allocate_label = QLabel("Algorithm:")
-        allocate_label.setStyleSheet(label_style)
-
-        # Style for combo boxes (dropdowns)
-        combo_style = """
-            QComboBox {
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                padding: 8px 12px;
-                background-color: white;
-                font-size: 14px;
-                color: #333;
-            }
-            QComboBox:hover {
-                border: 2px solid #bbb;
-            }
-            QComboBox:focus {
-                border: 2px solid #2196F3;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-            QComboBox QAbstractItemView {
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                background-color: white;
-                selection-background-color: #2196F3;
-                selection-color: white;
-                padding: 5px;
-            }
-        """
 
         # Dropdown to select allocation algorithm
         self.algorithms_cmb = QComboBox()
-        self.algorithms_cmb.addItem("First Fit")
-        self.algorithms_cmb.addItem("Best Fit")
-        self.algorithms_cmb.addItem("Worst Fit")
-        self.algorithms_cmb.addItem("Next Fit")
-        self.algorithms_cmb.setStyleSheet(combo_style)
+        self.algorithms_cmb.addItems(self._algo_names)
+        self.algorithms_cmb.currentIndexChanged.connect(self._select_algorithm)
 
         # Button to execute allocation using selected algorithm
         allocate_btn = QPushButton("ALLOCATE")
         allocate_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         allocate_btn.clicked.connect(self.allocate_job)
-        allocate_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2196F3, stop:1 #1976D2);
-                color: white;
-                border: none;
-                border-radius: 12px;
-                font-weight: bold;
-                font-size: 20px;
-            }
-            QPushButton:hover {
-                background: #2196F3;
-            }
-            QPushButton:pressed {
-                background: #1565C0;
-            }
-        """)
+        allocate_btn.setObjectName("allocateBtn")
 
         # Label for deallocation section
         deallocate_label = QLabel("Deallocate Job:")
-        deallocate_label.setStyleSheet(label_style)
         
         # Dropdown to select allocated job for deallocation
         self.allocated_jobs_cmb = QComboBox()
-        self.allocated_jobs_cmb.setStyleSheet(combo_style)
         
         # Button to deallocate selected job
         deallocate_btn = QPushButton("DEALLOCATE")
         deallocate_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding) 
         deallocate_btn.clicked.connect(self.deallocate_job)
-        deallocate_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #FF9800, stop:1 #F57C00);
-                color: white;
-                border: none;
-                border-radius: 12px;
-                font-weight: bold;
-                font-size: 20px;
-            }
-            QPushButton:hover {
-                background: #FF9800;
-            }
-            QPushButton:pressed {
-                background: #E65100;
-            }
-        """)
+        deallocate_btn.setObjectName("deallocateBtn")
 
         # Button to reset entire application state
         reset_btn = QPushButton("RESET")
         reset_btn.clicked.connect(self.reset)
-        reset_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #F44336, stop:1 #D32F2F);
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-weight: bold;
-                font-size: 16px;
-                padding: 20px;
-            }
-            QPushButton:hover {
-                background: #F44336;
-            }
-            QPushButton:pressed {
-                background: #B71C1C;
-            }
-        """)
+        reset_btn.setObjectName("resetBtn")
 
         # Assemble Operations section
         operations_section = QVBoxLayout()
@@ -373,61 +522,54 @@ class MainWindow(QMainWindow):
         Add a new job to the system.
         Validates input, creates Job object, and updates the jobs table.
         """
-        try:
-            # Parse and validate memory requirement input
-            memory_needed = int(self.memory_needed_field.text().strip())
-            if memory_needed <= 0:
-                raise ValueError
-        except ValueError:
+        # Parse and validate memory requirement input (digits only, no exception path)
+        text = self.memory_needed_field.text().strip()
+        memory_needed = int(text) if text.isdecimal() else 0
+        if memory_needed <= 0:
             # Clear field if invalid input
             self.memory_needed_field.clear()
             return
         
-        # Generate new job ID and add row to table
-        self.job_id += 1
-        row_position = self.jobs_table_widget.rowCount()
-        self.jobs_table_widget.insertRow(row_position)
-        
-        # Create table items with centered alignment
-        job_id_item = QTableWidgetItem(f"J{self.job_id}")
-        job_id_item.setTextAlignment(Qt.AlignCenter)
-        memory_item = QTableWidgetItem(f"{memory_needed} KB")
-        memory_item.setTextAlignment(Qt.AlignCenter)
-        status_item = QTableWidgetItem("Waiting")
-        status_item.setTextAlignment(Qt.AlignCenter)
-        
-        # Populate table row
-        self.jobs_table_widget.setItem(row_position, 0, job_id_item)
-        self.jobs_table_widget.setItem(row_position, 1, memory_item)
-        self.jobs_table_widget.setItem(row_position, 2, status_item)
-        
-        # Create Job object and add to jobs list
-        self.jobs.append(Job(self.job_id, memory_needed))
+        # Create the job and add it to the table
+        self.add_jobs_bulk([memory_needed])
 
         # Clear input field for next entry
         self.memory_needed_field.clear()
 
+    def add_jobs_bulk(self, memory_list):
+        """
+        Add several jobs at once with a single jobs table update.
+        
+        Args:
+            memory_list: Memory needed by each new job (positive integers, already validated)
+        """
+        # Generate new job IDs and create Job objects
+        jobs = [Job(self.job_id + i, memory_needed) for i, memory_needed in enumerate(memory_list, 1)]
+        self.job_id += len(jobs)
+        
+        # Add jobs to jobs list (through the model, which inserts their rows) and waiting bucket
+        self.jobs_model.extend(jobs)
+        self._waiting.extend(jobs)
+
     def add_partition(self):
         """
         Add a new memory partition to the system.
         Validates input, creates Partition object, and updates the partitions table.
         """
-        try:
-            # Parse and validate memory space input
-            memory_space = int(self.memory_space_field.text().strip())
-            if memory_space <= 0:
-                raise ValueError
-        except ValueError:
+        # Parse and validate memory space input (digits only, no exception path)
+        text = self.memory_space_field.text().strip()
+        memory_space = int(text) if text.isdecimal() else 0
+        if memory_space <= 0:
             # Clear field if invalid input
             self.memory_space_field.clear()
             return
         
         # Generate new partition ID and create Partition object
         self.partition_id += 1
-        self.partitions.append(Partition(self.partition_id, memory_space))
         
-        # Update partitions table to reflect new partition
-        self.update_partitions_table()
+        # Add partition to partitions list through the model, which inserts its row
+        self.partitions_model.append(Partition(self.partition_id, memory_space))
+        insort(self._free_partitions, (memory_space, len(self.partitions) - 1))
         
         # Clear input field for next entry
         self.memory_space_field.clear()
@@ -441,93 +583,145 @@ class MainWindow(QMainWindow):
         if not self.jobs:
             return
         
-        # Get selected algorithm and filter jobs by status
-        algorithm = self.algorithms_cmb.currentText()
-        waiting_jobs = [job for job in self.jobs if job.status == "waiting"]
-        allocated_jobs = [job for job in self.jobs if job.status == "allocated"]
+        # Get selected algorithm
+        algorithm = self._algo_table[self._algo_idx]
         
-        # Exit if no waiting jobs
-        if not waiting_jobs:
+        # Exit if no waiting jobs, or if even the smallest one cannot fit anywhere
+        smallest = self._waiting.peek_smallest()
+        max_free = self._max_free_space()
+        if smallest is None or smallest.memory_needed > max_free:
             return
         
-        # Execute appropriate allocation algorithm
-        if algorithm == "First Fit":
-            first_fit(self.partitions, waiting_jobs, allocated_jobs)
-        elif algorithm == "Best Fit":
-            best_fit(self.partitions, waiting_jobs, allocated_jobs)
-        elif algorithm == "Worst Fit":
-            worst_fit(self.partitions, waiting_jobs, allocated_jobs)
-        elif algorithm == "Next Fit":
-            # Next Fit requires tracking last allocation position
-            self.next_fit_last_index = next_fit(self.partitions, waiting_jobs, allocated_jobs, self.next_fit_last_index)
+        # Execute selected allocation algorithm; it also drops allocated jobs from the queue
+        newly_allocated = {}  # Collects this round's allocations without scanning the whole bucket
+        self._waiting.allocate(algorithm, self.partitions, newly_allocated)
+        self._allocated.update(newly_allocated)
         
         # Update UI to reflect allocation changes
-        self.update_partitions_table()
-        self.update_allocated_jobs_combo()
-        self.update_jobs_status()
+        self._refresh_all([job.partition for job in newly_allocated], newly_allocated, added=newly_allocated)
+
+    def _max_free_space(self):
+        """
+        Return the size of the largest free partition (0 if none are free).
+        Reads the end of the size-sorted free list instead of scanning all partitions.
+        """
+        free = self._free_partitions
+        # Drop entries for partitions filled by First/Next Fit since they were added
+        while free and self.partitions[free[-1][1]].current_job is not None:
+            free.pop()
+        return free[-1][0] if free else 0
+
+    def _select_algorithm(self, index):
+        """
+        Remember the algorithm chosen in the dropdown so allocate_job can index it directly.
+        
+        Args:
+            index: New current index of the algorithm dropdown
+        """
+        if index >= 0:
+            self._algo_idx = index
+
+    def _run_next_fit(self, partitions, waiting_jobs, allocated_jobs):
+        """
+        Run Next Fit with the same signature as the other algorithms.
+        Carries the last allocation position between calls.
+        """
+        self.next_fit_last_index = next_fit(partitions, waiting_jobs, allocated_jobs, self.next_fit_last_index)
 
-    def update_partitions_table(self):
+    def _refresh_all(self, changed_partitions, changed_jobs, added=(), removed=()):
+        """
+        Bring both tables and the allocated jobs dropdown up to date in one pass.
+        All three widgets repaint once, after every change has been applied.
+        
+        Args:
+            changed_partitions: Partitions whose allocated job changed
+            changed_jobs: Jobs whose status changed
+            added: Jobs to append to the allocated jobs dropdown
+            removed: Jobs to remove from the allocated jobs dropdown
+        """
+        with batched_updates(self.partitions_table_view, self.jobs_table_view, self.allocated_jobs_cmb):
+            self.update_partitions_table(changed_partitions)
+            if added:
+                self.add_to_allocated_jobs_combo(added)
+            for job in removed:
+                self.remove_from_allocated_jobs_combo(job)
+            if added or removed:
+                self.allocated_jobs_cmb.setCurrentIndex(0)  # Select the first job after every change
+            self.update_jobs_status(changed_jobs)
+
+    def update_partitions_table(self, changed_partitions):
         """
         Refresh the partitions table to show current allocation state.
         Displays partition ID, size, and any allocated job.
+        Called inside _refresh_all, which batches the repaint.
+        
+        Args:
+            changed_partitions: Partitions whose allocated job changed
         """
-        # Set table structure
-        self.partitions_table_widget.setColumnCount(2)
-        self.partitions_table_widget.setHorizontalHeaderLabels(["Partition", "Allocated Job"])
-        self.partitions_table_widget.setRowCount(len(self.partitions))
-        self.partitions_table_widget.setEditTriggers(QTableWidget.NoEditTriggers)  # Read-only
-        self.partitions_table_widget.horizontalHeader().setStretchLastSection(True)
-        self.partitions_table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        
-        # Populate each row with partition information
-        for i, partition in enumerate(self.partitions):
-            # Display partition ID and size
-            partition_text = f"F{partition.partition_id} ({partition.memory_space} KB)"
-            partition_item = QTableWidgetItem(partition_text)
-            partition_item.setTextAlignment(Qt.AlignCenter)
-            self.partitions_table_widget.setItem(i, 0, partition_item)
-            
-            # Display allocated job if partition is occupied
-            if partition.occupied and partition.current_job:
-                job_text = f"J{partition.current_job.job_id} ({partition.current_job.memory_needed} KB)"
-                job_item = QTableWidgetItem(job_text)
-                job_item.setTextAlignment(Qt.AlignCenter)
-                self.partitions_table_widget.setItem(i, 1, job_item)
-            else:
-                # Leave cell empty if partition is free
-                empty_item = QTableWidgetItem("")
-                self.partitions_table_widget.setItem(i, 1, empty_item)
-
-    def update_allocated_jobs_combo(self):
-        """
-        Refresh the allocated jobs dropdown with currently allocated jobs.
-        Used for selecting which job to deallocate.
+        # Only the allocated job column changes after construction
+        self.partitions_model.refresh_cells(changed_partitions, PartitionsModel.JOB_COLUMN)
+
+    def _clear_allocated_jobs_combo(self):
+        """
+        Empty the allocated jobs dropdown and its row bookkeeping (used by reset).
         """
         self.allocated_jobs_cmb.clear()
-        # Add each allocated job to dropdown with job reference as data
-        for job in self.jobs:
-            if job.status == "allocated":
-                self.allocated_jobs_cmb.addItem(f"J{job.job_id} ({job.memory_needed} KB)", job)
+        self._combo_items.clear()
+        self._combo_ids.clear()
 
-    def update_jobs_status(self):
+    def add_to_allocated_jobs_combo(self, jobs):
+        """
+        Insert newly allocated jobs into the allocated jobs dropdown, keeping it in job ID order.
+        Called inside _refresh_all, which batches the repaint.
+        
+        Args:
+            jobs: Job objects that were just allocated
+        """
+        if not jobs:
+            return
+        root = self.allocated_jobs_cmb.model().invisibleRootItem()
+        ids = self._combo_ids
+        jobs = sorted(jobs, key=lambda job: job.job_id)
+        # Build one item per allocated job with job reference as data
+        items = []
+        for job in jobs:
+            item = QStandardItem(job.label)
+            item.setData(job, Qt.UserRole)
+            items.append(item)
+            self._combo_items[job] = item
+        if not ids or jobs[0].job_id > ids[-1]:
+            # All new jobs come after the existing rows: insert them in a single call
+            ids.extend(job.job_id for job in jobs)
+            root.appendRows(items)
+        else:
+            # Slot each job in among the existing rows by ID
+            for job, item in zip(jobs, items):
+                pos = bisect_left(ids, job.job_id)
+                ids.insert(pos, job.job_id)
+                root.insertRow(pos, item)
+
+    def remove_from_allocated_jobs_combo(self, job):
+        """
+        Remove a deallocated job from the allocated jobs dropdown.
+        Called inside _refresh_all, which batches the repaint.
+        
+        Args:
+            job: Job object that was just deallocated
+        """
+        row = self._combo_items.pop(job).row()
+        del self._combo_ids[row]
+        self.allocated_jobs_cmb.model().removeRow(row)
+
+    def update_jobs_status(self, changed_jobs):
         """
         Refresh the status column in the jobs table to reflect current job states.
-        Updates status for all jobs (waiting, allocated, finished).
+        Called inside _refresh_all, which batches the repaint.
+        
+        Args:
+            changed_jobs: Jobs whose status changed
         """
-        # Iterate through each row in jobs table
-        for row in range(self.jobs_table_widget.rowCount()):
-            # Extract job ID from table cell
-            job_id_text = self.jobs_table_widget.item(row, 0).text()
-            job_id = int(job_id_text[1:])  # Remove "J" prefix and convert to int
-            
-            # Find corresponding job object and update status
-            for job in self.jobs:
-                if job.job_id == job_id:
-                    status_text = job.status.capitalize()
-                    status_item = QTableWidgetItem(status_text)
-                    status_item.setTextAlignment(Qt.AlignCenter)
-                    self.jobs_table_widget.setItem(row, 2, status_item)
-                    break
+        # One change notification per job; repainted together when updates resume
+        self.jobs_model.refresh_cells(changed_jobs, JobsModel.STATUS_COLUMN)
 
     def deallocate_job(self):
         """
@@ -542,37 +736,30 @@ class MainWindow(QMainWindow):
         job_to_remove = self.allocated_jobs_cmb.currentData()
         
         if job_to_remove:
-            # Filter jobs by current status
-            allocated_jobs = [job for job in self.jobs if job.status == "allocated"]
-            finished_jobs = [job for job in self.jobs if job.status == "finished"]
-            
-            # Execute deallocation
-            deallocate(self.partitions, allocated_jobs, finished_jobs, job_to_remove)
+            # Execute deallocation (finished jobs are only shown in the jobs table, not kept in a list)
+            freed_partition = job_to_remove.partition
+            deallocate(self.partitions, self._allocated, None, job_to_remove, self._free_partitions)
             
             # Update UI to reflect deallocation
-            self.update_partitions_table()
-            self.update_allocated_jobs_combo()
-            self.update_jobs_status()
+            self._refresh_all([freed_partition], [job_to_remove], removed=[job_to_remove])
 
     def reset(self):
         """
         Reset the entire application to initial state.
         Clears all jobs, partitions, and resets all counters.
         """
-        # Clear all data structures
-        self.jobs.clear()
-        self.partitions.clear()
+        # Clear all data structures (the models also reset their tables)
+        self.jobs_model.clear()
+        self._waiting.clear()
+        self._allocated.clear()
+        self.partitions_model.clear()
+        self._free_partitions.clear()
         self.next_fit_last_index = 0
         self.job_id = 0
         self.partition_id = 0
         
-        # Clear all table displays
-        self.jobs_table_widget.setRowCount(0)
-        self.partitions_table_widget.setRowCount(0)
-        self.partitions_table_widget.setColumnCount(0)
-        
         # Clear allocated jobs dropdown
-        self.allocated_jobs_cmb.clear()
+        self._clear_allocated_jobs_combo()
 
 def main():
     """
@@ -585,6 +772,9 @@ def main():
     # Set application-wide font
     font = QFont("Segoe UI", 10)
     app.setFont(font)
+    
+    # Apply application-wide style sheet once
+    app.setStyleSheet(APP_QSS)
 
     # Create and display main window
     window = MainWindow()
@@ -1,3 +1,77 @@
+from bisect import bisect_left
+from partition.memory_classes import STATUS_WAITING, STATUS_ALLOCATED, STATUS_FINISHED
+
+def _assign(partition, job, allocated_jobs):
+    """
+    Places a job into a partition and records the state transition.
+    
+    Args:
+        partition: Free Partition object selected by an algorithm
+        job: Waiting Job object to place in the partition
+        allocated_jobs: Dict whose keys are the allocated Job objects, in allocation order
+    """
+    partition.current_job = job  # Assign job to partition
+    job.partition = partition  # Remember partition for O(1) deallocation
+    job.status = STATUS_ALLOCATED  # Update job status
+    allocated_jobs[job] = None  # Add to allocated jobs (dict keys act as an ordered set)
+
+def _remove_allocated(waiting_jobs):
+    """
+    Removes jobs that are no longer waiting from the waiting queue in a single pass.
+    Replaces per-job list.remove() calls, which rescan the queue each time.
+    """
+    waiting_jobs[:] = [job for job in waiting_jobs if job.status == STATUS_WAITING]
+
+def _position(partitions, partition):
+    """
+    Returns the index of a partition in the partitions list.
+    Partition IDs are handed out as 1..N in list order, so the ID is tried first.
+    
+    Args:
+        partitions: List of Partition objects
+        partition: Partition object to locate
+    """
+    index = partition.partition_id - 1
+    if 0 <= index < len(partitions) and partitions[index] is partition:
+        return index
+    return partitions.index(partition)  # IDs were not assigned densely
+
+def _free_by_size(partitions):
+    """
+    Returns a sorted list of (memory_space, index) pairs for the free partitions.
+    Equal sizes are ordered by index, so bisecting finds the lowest-index best fit.
+    """
+    return sorted((partition.memory_space, i) for i, partition in enumerate(partitions) if partition.current_job is None)
+
+def _free_in_order(partitions):
+    """
+    Returns parallel lists (indices, sizes) for the free partitions, in memory order.
+    Scans then compare plain ints instead of loading attributes from each Partition.
+    """
+    indices = [i for i, partition in enumerate(partitions) if partition.current_job is None]
+    sizes = [partitions[i].memory_space for i in indices]
+    return indices, sizes
+
+def _next_fit_position(free_sizes, memory_needed, start):
+    """
+    Returns the position in free_sizes of the first partition that can hold memory_needed,
+    searching circularly from position start, or -1.
+    
+    Args:
+        free_sizes: Sizes of the free partitions, in memory order
+        memory_needed: Memory required by the job
+        start: Position to start searching from
+    """
+    # Check free partitions from start to the end of memory
+    for pos in range(start, len(free_sizes)):
+        if memory_needed <= free_sizes[pos]:
+            return pos
+    # Wrap around and check free partitions before start
+    for pos in range(start):
+        if memory_needed <= free_sizes[pos]:
+            return pos
+    return -1
+
 def first_fit(partitions, waiting_jobs, allocated_jobs):
     """
     First Fit Algorithm: Allocates each job to the first available partition that can fit it.
@@ -6,26 +80,32 @@ def first_fit(partitions, waiting_jobs, allocated_jobs):
     Args:
         partitions: List of Partition objects available for allocation
         waiting_jobs: List of Job objects waiting to be allocated
-        allocated_jobs: List of Job objects that have been successfully allocated
+        allocated_jobs: Dict whose keys are the allocated Job objects, in allocation order
     
     Strategy:
         - Fast allocation (stops at first fit)
         - May create fragmentation at the beginning of memory
     """
+    # Collect free partitions once, in memory order, so occupied ones are never rescanned
+    free, free_sizes = _free_in_order(partitions)
+    largest = max(free_sizes, default=0)  # Upper bound on what can still fit this call
+
     # Try to allocate each waiting job
-    for job in waiting_jobs[:]:  # Create a copy to safely modify list during iteration
+    for job in waiting_jobs:  # Queue is only rebuilt after the loop
+        memory_needed = job.memory_needed
+        if memory_needed > largest:
+            continue  # Fits nowhere, skip the scan
         # Check and assign if it fits in a free partition
-        for partition in partitions:
-            # Check if partition is free and large enough for the job
-            if not partition.occupied and job.memory_needed <= partition.memory_space:
-                partition.current_job = job  # Assign job to partition
-                partition.occupied = True  # Mark partition as occupied
-                job.status = "allocated"  # Update job status
-                waiting_jobs.remove(job)  # Remove from waiting queue
-                allocated_jobs.append(job)  # Add to allocated list
+        for pos, size in enumerate(free_sizes):
+            if memory_needed <= size:
+                i = free.pop(pos)  # Partition is no longer free
+                del free_sizes[pos]
+                _assign(partitions[i], job, allocated_jobs)
                 break  # Move to next job after successful allocation
 
-def best_fit(partitions, waiting_jobs, allocated_jobs):
+    _remove_allocated(waiting_jobs)  # Remove allocated jobs from waiting queue
+
+def best_fit(partitions, waiting_jobs, allocated_jobs, free=None):
     """
     Best Fit Algorithm: Allocates each job to the partition with the smallest sufficient space.
     Minimizes internal fragmentation (wasted space within a partition).
@@ -33,38 +113,35 @@ def best_fit(partitions, waiting_jobs, allocated_jobs):
     Args:
         partitions: List of Partition objects available for allocation
         waiting_jobs: List of Job objects waiting to be allocated
-        allocated_jobs: List of Job objects that have been successfully allocated
+        allocated_jobs: Dict whose keys are the allocated Job objects, in allocation order
+        free: Optional size-sorted list of (memory_space, index) pairs kept between calls
+              (must include every free partition; see deallocate). Built when omitted.
     
     Strategy:
         - Minimizes wasted space per allocation
-        - Scans all partitions to find the best fit
+        - Binary-searches free partitions sorted by size to find the best fit
         - May leave many small unusable fragments
     """
+    # Sort free partitions by size once instead of scanning all partitions per job
+    if free is None:
+        free = _free_by_size(partitions)
+
     # Try to allocate each waiting job
-    for job in waiting_jobs[:]:  # Create a copy to safely modify list during iteration
-        smallest_internal_fragmentation = float('inf')  # Track minimum waste
-        selected_index = -1  # Index of best-fit partition
-
-        # Check if it fits in each partition and find the one with smallest waste
-        for i, partition in enumerate(partitions):
-            if not partition.occupied and job.memory_needed <= partition.memory_space:
-                # Compute internal fragmentation (wasted space in this partition)
-                internal_fragmentation = partition.memory_space - job.memory_needed
-                # Update if this partition has less waste than previous candidates
-                if internal_fragmentation < smallest_internal_fragmentation:
-                    smallest_internal_fragmentation = internal_fragmentation
-                    selected_index = i
+    for job in waiting_jobs:  # Queue is only rebuilt after the loop
+        # Find the smallest free partition that fits (smallest waste)
+        pos = bisect_left(free, (job.memory_needed, -1))
+        while pos < len(free) and partitions[free[pos][1]].current_job is not None:
+            del free[pos]  # Drop partitions filled by another algorithm since the list was built
 
         # Assign job if a suitable partition was found
-        if selected_index != -1:
-            partitions[selected_index].current_job = job  # Assign job to best partition
-            partitions[selected_index].occupied = True  # Mark partition as occupied
-            job.status = "allocated"  # Update job status
-            waiting_jobs.remove(job)  # Remove from waiting queue
-            allocated_jobs.append(job)  # Add to allocated list
+        if pos < len(free):
+            _, selected_index = free.pop(pos)  # Partition is no longer free
+            _assign(partitions[selected_index], job, allocated_jobs)
         # Else job remains waiting (no suitable partition found)
 
-def worst_fit(partitions, waiting_jobs, allocated_jobs):
+    _remove_allocated(waiting_jobs)  # Remove allocated jobs from waiting queue
+
+def worst_fit(partitions, waiting_jobs, allocated_jobs, free=None):
     """
     Worst Fit Algorithm: Allocates each job to the partition with the largest sufficient space.
     Maximizes remaining space in partitions to accommodate future jobs.
@@ -72,37 +149,36 @@ def worst_fit(partitions, waiting_jobs, allocated_jobs):
     Args:
         partitions: List of Partition objects available for allocation
         waiting_jobs: List of Job objects waiting to be allocated
-        allocated_jobs: List of Job objects that have been successfully allocated
+        allocated_jobs: Dict whose keys are the allocated Job objects, in allocation order
+        free: Optional size-sorted list of (memory_space, index) pairs kept between calls
+              (must include every free partition; see deallocate). Built when omitted.
     
     Strategy:
         - Leaves larger fragments that may be useful for future allocations
         - May lead to more external fragmentation overall
-        - Scans all partitions to find the worst fit
+        - Takes the largest free partition from a size-sorted free list
     """
+    # Sort free partitions by size once; the largest is always at the end
+    if free is None:
+        free = _free_by_size(partitions)
+
     # Try to allocate each waiting job
-    for job in waiting_jobs[:]:  # Create a copy to safely modify list during iteration
-        largest_internal_fragmentation = -1  # Track maximum remaining space
-        selected_index = -1  # Index of worst-fit partition
-
-        # Check if it fits in each partition and find the one with most remaining space
-        for i, partition in enumerate(partitions):
-            if not partition.occupied and job.memory_needed <= partition.memory_space:
-                # Compute internal fragmentation (remaining space in this partition)
-                internal_fragmentation = partition.memory_space - job.memory_needed
-                # Update if this partition has more remaining space than previous candidates
-                if internal_fragmentation > largest_internal_fragmentation:
-                    largest_internal_fragmentation = internal_fragmentation
-                    selected_index = i
+    for job in waiting_jobs:  # Queue is only rebuilt after the loop
+        while free and partitions[free[-1][1]].current_job is not None:
+            free.pop()  # Drop partitions filled by another algorithm since the list was built
 
-        # Assign job if a suitable partition was found
-        if selected_index != -1:
-            partitions[selected_index].current_job = job  # Assign job to worst-fit partition
-            partitions[selected_index].occupied = True  # Mark partition as occupied
-            job.status = "allocated"  # Update job status
-            waiting_jobs.remove(job)  # Remove from waiting queue
-            allocated_jobs.append(job)  # Add to allocated list
+        # Assign job if the largest free partition fits (most remaining space)
+        if free and job.memory_needed <= free[-1][0]:
+            # Among equally large partitions, pick the lowest index
+            pos = bisect_left(free, (free[-1][0], -1))
+            while partitions[free[pos][1]].current_job is not None:
+                del free[pos]  # Stops at the last entry at the latest, which is free
+            _, selected_index = free.pop(pos)  # Partition is no longer free
+            _assign(partitions[selected_index], job, allocated_jobs)
         # Else job remains waiting (no suitable partition found)
 
+    _remove_allocated(waiting_jobs)  # Remove allocated jobs from waiting queue
+
 def next_fit(partitions, waiting_jobs, allocated_jobs, last_index=0):
     """
     Next Fit Algorithm: Similar to First Fit, but continues searching from where it last left off.
@@ -111,7 +187,7 @@ def next_fit(partitions, waiting_jobs, allocated_jobs, last_index=0):
     Args:
         partitions: List of Partition objects available for allocation
         waiting_jobs: List of Job objects waiting to be allocated
-        allocated_jobs: List of Job objects that have been successfully allocated
+        allocated_jobs: Dict whose keys are the allocated Job objects, in allocation order
         last_index: Index of the last allocated partition (default: 0)
     
     Returns:
@@ -122,50 +198,55 @@ def next_fit(partitions, waiting_jobs, allocated_jobs, last_index=0):
         - Faster than First Fit for repeated allocations
         - Uses circular search starting after last allocation point
     """
-    n = len(partitions)  # Total number of partitions
+    # Collect free partitions once, in memory order, so occupied ones are never rescanned
+    free, free_sizes = _free_in_order(partitions)
+    largest = max(free_sizes, default=0)  # Upper bound on what can still fit this call
 
     # Try to allocate each waiting job  
-    for job in waiting_jobs[:]:  # Create a copy to safely modify list during iteration
-
-        # Check and assign if it fits in a free partition, starting after last_index
-        for i in range(n):  # Check all partitions in circular order
-            idx = (last_index + i) % n  # Calculate circular index (wraps around)
-            partition = partitions[idx]
-            # Check if partition is free and large enough for the job
-            if not partition.occupied and job.memory_needed <= partition.memory_space:
-                partition.current_job = job  # Assign job to partition
-                partition.occupied = True  # Mark partition as occupied
-                job.status = "allocated"  # Update job status
-                waiting_jobs.remove(job)  # Remove from waiting queue
-                allocated_jobs.append(job)  # Add to allocated list
-                last_index = idx  # Remember this position for next allocation
-                break  # Move to next job after successful allocation
+    for job in waiting_jobs:  # Queue is only rebuilt after the loop
+        if job.memory_needed > largest:
+            continue  # Fits nowhere, skip the scan
+
+        # Assign job if it fits in a free partition, starting at the first one at or after last_index
+        pos = _next_fit_position(free_sizes, job.memory_needed, bisect_left(free, last_index))
+        if pos != -1:
+            selected_index = free.pop(pos)  # Partition is no longer free
+            del free_sizes[pos]
+            _assign(partitions[selected_index], job, allocated_jobs)
+            last_index = selected_index  # Remember this position for next allocation
 
+    _remove_allocated(waiting_jobs)  # Remove allocated jobs from waiting queue
     return last_index  # Return updated index for future calls
 
-def deallocate(partitions, allocated_jobs, finished_jobs, job_to_remove):
+def deallocate(partitions, allocated_jobs, finished_jobs, job_to_remove, free=None):
     """
     Deallocates a job from memory, freeing up its partition for future allocations.
     
     Args:
         partitions: List of Partition objects
-        allocated_jobs: List of currently allocated Job objects
-        finished_jobs: List of Job objects that have completed
+        allocated_jobs: Dict whose keys are the currently allocated Job objects
+        finished_jobs: List of Job objects that have completed, or None if finished jobs are not kept
         job_to_remove: The Job object to deallocate
+        free: Optional size-sorted free list (as used by best_fit/worst_fit) to add the partition to
     
     Process:
-        1. Find the partition containing the job
+        1. Look up the partition containing the job
         2. Free the partition
         3. Update job lists and status
     """
-    # Find the partition containing this job
-    for partition in partitions:
-        if partition.current_job == job_to_remove:
-            partition.current_job = None  # Remove job reference
-            partition.occupied = False  # Mark partition as free
-            break  # Stop searching once found
+    # Free the partition containing this job (recorded on the job at allocation)
+    partition = job_to_remove.partition
+    partition.current_job = None  # Remove job reference, which marks the partition as free
+    job_to_remove.partition = None
+    if free is not None:
+        # Add to the free list unless an entry was left behind by another algorithm
+        entry = (partition.memory_space, _position(partitions, partition))
+        pos = bisect_left(free, entry)
+        if pos == len(free) or free[pos] != entry:
+            free.insert(pos, entry)
     
     # Update job lists
-    allocated_jobs.remove(job_to_remove)  # Remove from allocated list
-    finished_jobs.append(job_to_remove)  # Add to finished list
-    job_to_remove.status = "finished"  # Update job status
\ No newline at end of file
+    del allocated_jobs[job_to_remove]  # Remove from allocated jobs by key
+    if finished_jobs is not None:
+        finished_jobs.append(job_to_remove)  # Add to finished list
+    job_to_remove.status = STATUS_FINISHED  # Update job status
\ No newline at end of file
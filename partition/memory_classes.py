@@ -1,9 +1,18 @@
+# Job status codes; integers so status checks are plain int compares
+STATUS_WAITING = 0
+STATUS_ALLOCATED = 1
+STATUS_FINISHED = 2
+STATUS_NAMES = ("waiting", "allocated", "finished")  # Display names, indexed by status code
+
 class Partition():
     """
     Represents a memory partition in a memory management system.
     Used for fixed partition memory allocation schemes.
     """
     
+    # Fixed attribute set: no per-instance __dict__ and faster attribute access in the fit loops
+    __slots__ = ("partition_id", "memory_space", "current_job", "label")
+    
     def __init__(self, partition_id, memory_space):
         """
         Initialize a memory partition.
@@ -14,8 +23,16 @@ class Partition():
         """
         self.partition_id = partition_id  # Unique ID to identify this partition
         self.memory_space = memory_space  # Total memory capacity of this partition
-        self.occupied = False  # Flag indicating if partition is currently in use
         self.current_job = None  # Reference to the job currently occupying this partition (None if empty)
+        self.label = f"F{partition_id} ({memory_space} KB)"  # Display text, cached since ID and size never change
+
+    @property
+    def occupied(self):
+        """
+        True if a job currently occupies this partition.
+        Derived from current_job so the two can never disagree.
+        """
+        return self.current_job is not None
 
 class Job():
     """
@@ -23,6 +40,9 @@ class Job():
     Tracks the job's memory requirements and current status.
     """
     
+    # Fixed attribute set: no per-instance __dict__ and faster attribute access in the fit loops
+    __slots__ = ("job_id", "memory_needed", "status", "partition", "label", "id_label", "memory_label")
+    
     def __init__(self, job_id, memory_needed):
         """
         Initialize a job with its memory requirements.
@@ -33,4 +53,9 @@ class Job():
         """
         self.job_id = job_id  # Unique ID to identify this job
         self.memory_needed = memory_needed  # Memory size required by this job
-        self.status = "waiting"  # Current status of the job (e.g., "waiting", "allocated", "finished")
\ No newline at end of file
+        self.status = STATUS_WAITING  # Current status code of the job (see STATUS_NAMES)
+        self.partition = None  # Reference to the partition this job occupies (None if not allocated)
+        self.label = f"J{job_id} ({memory_needed} KB)"  # Display text, cached since ID and size never change
+        self.id_label = f"J{job_id}"  # Jobs table ID cell text
+        self.memory_label = f"{memory_needed} KB"  # Jobs table memory cell text
+
@@ -0,0 +1,58 @@
+import heapq
+from itertools import count
+from partition.memory_classes import STATUS_WAITING
+
+class WaitingQueue():
+    """
+    Jobs waiting for a partition, kept in arrival order.
+    Also keeps a min-heap on memory needed so the smallest waiting job can be read without a scan.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty waiting queue.
+        """
+        self._jobs = []  # Waiting jobs in arrival order (First Come First Served)
+        self._heap = []  # (memory_needed, arrival number, job); entries for jobs no longer waiting are dropped lazily
+        self._arrivals = count()  # Tie-breaker so equal sizes keep arrival order and Jobs are never compared
+
+    def extend(self, jobs):
+        """
+        Add newly arrived jobs to the end of the queue.
+
+        Args:
+            jobs: Waiting Job objects in arrival order
+        """
+        self._jobs.extend(jobs)
+        for job in jobs:
+            heapq.heappush(self._heap, (job.memory_needed, next(self._arrivals), job))
+
+    def peek_smallest(self):
+        """
+        Return the waiting job that needs the least memory (None if no job is waiting).
+        If it does not fit in the largest free partition, no waiting job does.
+        """
+        heap = self._heap
+        # Drop entries for jobs the algorithms have allocated since they arrived
+        while heap and heap[0][2].status != STATUS_WAITING:
+            heapq.heappop(heap)
+        return heap[0][2] if heap else None
+
+    def allocate(self, algorithm, partitions, allocated_jobs):
+        """
+        Run an allocation algorithm over the waiting jobs in arrival order.
+        The algorithm removes the jobs it allocates, so the queue is rebuilt once.
+
+        Args:
+            algorithm: One of the fit functions from partition.algorithms (or a wrapper with the same signature)
+            partitions: List of Partition objects available for allocation
+            allocated_jobs: Dict that newly allocated jobs are added to as keys
+        """
+        algorithm(partitions, self._jobs, allocated_jobs)
+
+    def clear(self):
+        """
+        Remove every job from the queue.
+        """
+        self._jobs.clear()
+        self._heap.clear()